@@ -4,10 +4,26 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from types import MappingProxyType
+import hashlib
+import os
+import time
+from pathlib import Path
 import requests
-from typing import Optional, Dict, List
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.compute as pa_compute
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from typing import Callable, Optional, Dict, List, Tuple
 
 # 페이지 설정
 st.set_page_config(
@@ -17,15 +33,50 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 기간별 조회 일수 (기본값 1년)
+_PERIOD_DAYS = {
+    "1년": 365,
+    "3년": 365 * 3,
+    "5년": 365 * 5,
+    "10년": 365 * 10,
+}
+_CUSTOM = "사용자 지정"
 
-def date_to_week_format(date_obj: datetime) -> str:
+# 차트 전체 점 수가 이 값 이상이면 WebGL(scattergl)로 렌더링
+CHART_WEBGL_MIN_POINTS = 1000
+
+# 요일 표시 (date.weekday() 순서: 월=0 ... 일=6)
+_WEEKDAY_NAMES = ('월', '화', '수', '목', '금', '토', '일')
+
+
+def date_to_week_format(date_obj: date) -> str:
     """
     날짜를 YYYYWW 형식으로 변환
     예: 2025-12-26 → 202552 (2025년 52주차)
     """
-    year = date_obj.isocalendar()[0]  # ISO 연도
-    week = date_obj.isocalendar()[1]  # ISO 주차
-    return f"{year}{week:02d}"
+    return week_int_to_str(date_to_week_int(date_obj))
+
+
+def date_to_week_int(date_obj: date) -> int:
+    """
+    날짜를 YYYYWW 정수로 변환 (주차 연산용)
+    예: 2025-12-26 → 202552
+    """
+    # date/datetime 모두 같은 서수(ordinal) 키로 캐시 공유
+    return _ordinal_to_week_int(date_obj.toordinal())
+
+
+def week_int_to_str(week: int) -> str:
+    """YYYYWW 정수를 API 파라미터용 문자열로 변환"""
+    return str(week)
+
+
+@lru_cache(maxsize=4096)
+def _ordinal_to_week_int(ordinal: int) -> int:
+    """서수(ordinal) 날짜를 YYYYWW 정수로 변환 (캐시 사용)"""
+    iso = date.fromordinal(ordinal).isocalendar()
+    # 주차는 1~53 이므로 연도 * 100 + 주차 로 0 채움 없이 YYYYWW 생성
+    return iso[0] * 100 + iso[1]
 
 
 class PriceIndexAPI:
@@ -40,6 +91,14 @@ class PriceIndexAPI:
     }
     
     CYCLE_CODE = "WK"  # 주간
+    NO_DATA_CODE = "INFO-200"  # 조회 결과 없음 응답 코드
+    
+    MAX_WORKERS = 16  # 동시 요청 수
+    PAGE_SIZE = 1000  # API 최대 페이지 크기
+    CACHE_DIR = Path(__file__).parent / '.cache'  # API 응답 디스크 캐시
+    CACHE_TTL = 3600  # 최근 주차가 포함된 조회의 디스크 캐시 유효시간(초)
+    CACHE_MAX_AGE = 30 * 24 * 3600  # 이 기간 동안 갱신되지 않은 캐시 파일은 삭제(초)
+    ROW_FIELDS = ('WRTTIME_DESC', 'WRTTIME_IDTFR_ID', 'DTA_VAL')  # 응답 row에서 사용하는 필드
     
     # 지역코드 (전체)
     REGION_CODES = {
@@ -275,8 +334,20 @@ class PriceIndexAPI:
         '경남>진주시': '50255',
     }
     
+    # 지역코드 → 지역명 역색인 (읽기 전용)
+    REGION_NAMES_BY_CODE = MappingProxyType({v: k for k, v in REGION_CODES.items()})
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # 연결 재사용 (keep-alive) - 스레드 풀과 공유
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        # 일시적인 연결 오류, 요청 제한(429), 5xx 응답은 짧은 백오프로 재시도
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._prune_cache()
     
     def get_data(
         self,
@@ -309,7 +380,7 @@ class PriceIndexAPI:
             'Type': 'json',
             'Key': self.api_key,
             'pIndex': 1,
-            'pSize': 1000,  # 최대 1000개 (1년 = 52주, 여유있게)
+            'pSize': self.PAGE_SIZE,  # 최대 1000개 (1년 = 52주, 여유있게)
             'CLS_ID': region_code,
         }
         
@@ -318,67 +389,394 @@ class PriceIndexAPI:
             st.write(f"🔍 API 요청: {price_type}, 지역코드: {region_code}")
             st.write(f"   시작: {start_date}, 종료: {end_date}")
         
-        try:
-            response = requests.get(self.BASE_URL, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # 에러 체크
-            if 'RESULT' in data:
-                result = data['RESULT']
-                if result['CODE'] != 'INFO-000':
-                    return None
+        # 지역별 누적 시계열 캐시에서 기간을 잘라 사용 (없는 주차만 API 조회)
+        # 조회 오류는 그대로 전달 - st.cache_data에 실패 결과가 캐시되지 않도록
+        # 호출 측(get_multiple_data)에서 캐시 밖에서 처리
+        return self._fetch_incremental(params, price_type, statbl_id, region_code)
+    
+    def get_stale_data(
+        self,
+        price_type: str,
+        start_date: str,
+        end_date: str,
+        region_code: str
+    ) -> Optional[Tuple[pd.DataFrame, datetime]]:
+        """
+        API 장애 시 대체용 - 만료 여부와 관계없이 디스크 캐시에서 기간 데이터 조회
+        
+        지역별 누적 시계열을 먼저 보고, 없으면 같은 기간의 일괄 조회 캐시에서 찾음
+        
+        Returns:
+            (DataFrame, 캐시 저장 시각) 또는 None
+        """
+        statbl_id = self.STATBL_IDS.get(price_type)
+        if not statbl_id:
+            return None
+        
+        series_path = self._cache_path(statbl_id, region_code, 'series', '')
+        series = self._read_cache(series_path, ignore_ttl=True)
+        if series is not None and 'WRTTIME_IDTFR_ID' in series:
+            window = self._slice_series(series, int(start_date), int(end_date))
+            if window is not None:
+                return window, datetime.fromtimestamp(series_path.stat().st_mtime)
+        
+        bulk_path = self._cache_path(statbl_id, '*', start_date, end_date)
+        frame = self._read_cache(bulk_path, ignore_ttl=True)
+        if frame is not None:
+            window = frame[frame['CLS_ID'].astype(str) == region_code]
+            if not window.empty:
+                window = window.drop(columns='CLS_ID').reset_index(drop=True)
+                return window, datetime.fromtimestamp(bulk_path.stat().st_mtime)
+        
+        return None
+    
+    def get_data_bulk(
+        self,
+        price_type: str,
+        start_date: str,
+        end_date: str
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        전체 지역 가격지수 데이터를 일괄 조회 (CLS_ID 미지정)
+        
+        Args:
+            price_type: '매매' or '전세'
+            start_date: 시작 주차 (YYYYWW)
+            end_date: 종료 주차 (YYYYWW)
+        
+        Returns:
+            {지역코드: DataFrame} 또는 None (일괄 조회 실패 시)
+        """
+        statbl_id = self.STATBL_IDS.get(price_type)
+        if not statbl_id:
+            return None
+        
+        params = {
+            'STATBL_ID': statbl_id,
+            'DTACYCLE_CD': self.CYCLE_CODE,
+            'START_WRTTIME': start_date,
+            'END_WRTTIME': end_date,
+            'Type': 'json',
+            'Key': self.api_key,
+            'pIndex': 1,
+            'pSize': self.PAGE_SIZE,
+        }
+        
+        # 디스크 캐시 확인
+        cache_path = self._cache_path(statbl_id, '*', start_date, end_date)
+        frame = self._read_cache(cache_path, end_date)
+        
+        if frame is None:
+            if st.session_state.get('show_debug', False):
+                st.write(f"🔍 API 일괄 요청: {price_type}")
+                st.write(f"   시작: {start_date}, 종료: {end_date}")
             
-            # 데이터 추출
-            rows = []
-            if 'SttsApiTblData' in data:
-                stts_data = data['SttsApiTblData']
-                if isinstance(stts_data, list) and len(stts_data) > 1:
-                    if 'row' in stts_data[1]:
-                        rows = stts_data[1]['row']
-                        if not isinstance(rows, list):
-                            rows = [rows]
+            # 조회 오류는 그대로 전달 (호출 측에서 지역별 조회로 대체)
+            columns = self._fetch_all_rows(params, extra_columns=['CLS_ID'])
             
-            if not rows:
+            if not columns['DTA_VAL'] or columns['CLS_ID'][0] is None:
                 return None
             
-            df = pd.DataFrame(rows)
-            
-            # 주간 데이터 처리
-            # WRTTIME_DESC가 실제 날짜 (YYYY-MM-DD 형식)
-            if 'WRTTIME_DESC' in df.columns:
-                df['날짜'] = pd.to_datetime(df['WRTTIME_DESC'], format='%Y-%m-%d', errors='coerce')
-            elif 'WRTTIME_IDTFR_ID' in df.columns:
-                # WRTTIME_DESC가 없으면 WRTTIME_IDTFR_ID 사용
-                df['날짜'] = pd.to_datetime(df['WRTTIME_IDTFR_ID'], format='%Y%m%d', errors='coerce')
-            
-            # 숫자 변환
-            if 'DTA_VAL' in df.columns:
-                df['지수'] = pd.to_numeric(df['DTA_VAL'], errors='coerce')
-            
-            # 필요한 컬럼만 선택
-            result_df = df[['날짜', '지수']].copy()
-            result_df['가격유형'] = price_type
-            
-            # 날짜로 정렬
-            result_df = result_df.sort_values('날짜').reset_index(drop=True)
+            frame = self._columns_to_frame(columns, price_type, extra_columns=['CLS_ID'])
+            self._write_cache(cache_path, frame)
+        
+        # 지역코드별로 분리 (알 수 없는 지역코드는 제외)
+        return {
+            str(code): group.drop(columns='CLS_ID').reset_index(drop=True)
+            for code, group in frame.groupby('CLS_ID', sort=False)
+            if str(code) in self.REGION_NAMES_BY_CODE
+        }
+    
+    def _fetch_incremental(
+        self,
+        params: Dict,
+        price_type: str,
+        statbl_id: str,
+        region_code: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        지역별 누적 시계열 캐시를 이용해 캐시에 없는 주차만 조회
+        
+        주간 데이터는 뒤에만 추가되므로, 캐시된 시계열보다 앞선 구간(head)과
+        마지막 날짜 다음 주 이후(tail)만 요청하고 나머지는 캐시에서 잘라 씀
+        
+        head는 이미 확인한 가장 이른 주차(attrs['checked_from'])를 캐시에 함께 저장해
+        지역 시계열이 요청 시작보다 늦게 시작하는 경우 매번 빈 조회를 반복하지 않음
+        """
+        start_week, end_week = int(params['START_WRTTIME']), int(params['END_WRTTIME'])
+        series_path = self._cache_path(statbl_id, region_code, 'series', '')
+        series = self._read_cache(series_path)
+        
+        if series is None or series.empty or 'WRTTIME_IDTFR_ID' not in series:
+            # 캐시 없음 → 요청 구간 전체 조회
+            columns = self._fetch_all_rows(params)
+            if not columns['DTA_VAL']:
+                return None
+            series = self._series_frame(columns, price_type)
+            series.attrs['checked_from'] = start_week
+            self._write_cache(series_path, series)
+        else:
+            parts = [series]
+            week_ids = series['WRTTIME_IDTFR_ID']
+            first_week = int(week_ids.iloc[0])
+            checked_from = series.attrs.get('checked_from', first_week)
+            last_checked_at = series_path.stat().st_mtime
+            tail_checked = False
             
-            # 결측값 제거
-            result_df = result_df.dropna(subset=['날짜', '지수'])
+            # 캐시 시작보다 앞선 구간 (시계열이 끊기지 않도록 캐시 첫 주차까지 포함해 요청)
+            if checked_from > start_week:
+                columns = self._fetch_all_rows({**params, 'END_WRTTIME': str(first_week)})
+                if columns['DTA_VAL']:
+                    parts.insert(0, self._series_frame(columns, price_type))
+                checked_from = start_week
             
-            return result_df
+            # 캐시 마지막 주차 이후 구간 (마지막 주차부터 요청해 새 주차가 있는지 확인)
+            # (최근 2주는 아직 공표 전일 수 있으므로 CACHE_TTL 안에 확인했으면 다시 요청하지 않음)
+            last_week = int(week_ids.iloc[-1])
+            if last_week < end_week:
+                checked_recently = (
+                    series['날짜'].iloc[-1] >= pd.Timestamp(date.today() - timedelta(days=21))
+                    and time.time() - series_path.stat().st_mtime <= self.CACHE_TTL
+                )
+                if not checked_recently:
+                    tail_checked = True
+                    columns = self._fetch_all_rows({**params, 'START_WRTTIME': str(last_week)})
+                    tail = self._series_frame(columns, price_type) if columns['DTA_VAL'] else None
+                    if tail is not None and (tail['WRTTIME_IDTFR_ID'] > last_week).any():
+                        parts.append(tail)
+                    else:
+                        # 새 데이터 없음 → 확인 시각만 기록
+                        self._touch_cache(series_path)
             
-        except Exception as e:
-            st.error(f"데이터 조회 오류: {e}")
+            if len(parts) > 1 or checked_from != series.attrs.get('checked_from'):
+                series = pd.concat(parts, ignore_index=True)
+                series = series.drop_duplicates('WRTTIME_IDTFR_ID', keep='last').reset_index(drop=True)
+                series.attrs['checked_from'] = checked_from
+                self._write_cache(series_path, series)
+                if not tail_checked:
+                    # tail은 확인하지 않았으므로 마지막 확인 시각(수정 시각)은 유지
+                    self._touch_cache(series_path, last_checked_at)
+        
+        return self._slice_series(series, start_week, end_week)
+    
+    def _series_frame(self, columns: Dict[str, list], price_type: str) -> pd.DataFrame:
+        """API 필드별 값 목록 → 누적 시계열 캐시용 DataFrame (API 주차 ID를 정수로 함께 보관)"""
+        frame = self._columns_to_frame(columns, price_type, extra_columns=['WRTTIME_IDTFR_ID'])
+        week_ids = pd.to_numeric(frame['WRTTIME_IDTFR_ID'], errors='coerce')
+        frame = frame[week_ids.notna()].reset_index(drop=True)
+        frame['WRTTIME_IDTFR_ID'] = week_ids.dropna().to_numpy(dtype=np.int32)
+        return frame
+    
+    @staticmethod
+    def _slice_series(series: pd.DataFrame, start_week: int, end_week: int) -> Optional[pd.DataFrame]:
+        """누적 시계열에서 API 주차 ID 기준으로 요청 구간만 잘라 반환 (주차 ID 컬럼 제외)"""
+        week_ids = series['WRTTIME_IDTFR_ID']
+        window = series[(week_ids >= start_week) & (week_ids <= end_week)]
+        if window.empty:
+            return None
+        return window.drop(columns='WRTTIME_IDTFR_ID').reset_index(drop=True)
+    
+    def _cache_path(self, statbl_id: str, region_code: str, start_date: str, end_date: str) -> Path:
+        """(통계표, 지역코드, 기간) 단위 디스크 캐시 파일 경로"""
+        key = hashlib.sha1(f"{statbl_id}|{region_code}|{start_date}|{end_date}".encode()).hexdigest()
+        return self.CACHE_DIR / f"{key}.parquet"
+    
+    def _read_cache(
+        self,
+        path: Path,
+        end_date: Optional[str] = None,
+        ignore_ttl: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        디스크 캐시 조회
+        
+        지난 주차 데이터는 바뀌지 않으므로 만료 없이 사용하고,
+        최근 2주가 포함된 조회(end_date)만 CACHE_TTL 경과 시 다시 조회
+        (ignore_ttl=True 이면 만료 여부와 관계없이 반환 - API 장애 대비)
+        """
+        try:
+            if not path.exists():
+                return None
+            if ignore_ttl:
+                return pd.read_parquet(path)
+            recent_week = date_to_week_int(date.today() - timedelta(days=14))
+            is_recent = end_date is not None and int(end_date) >= recent_week
+            if is_recent and time.time() - path.stat().st_mtime > self.CACHE_TTL:
+                return None
+            return pd.read_parquet(path)
+        except Exception:
             return None
     
+    def _write_cache(self, path: Path, df: pd.DataFrame):
+        """디스크 캐시 저장 (임시 파일에 쓴 뒤 교체 - 동시 쓰기에도 안전)"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp")
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass
+    
+    def _touch_cache(self, path: Path, mtime: Optional[float] = None):
+        """디스크 캐시 파일의 수정 시각을 갱신 (마지막 확인 시각 기록, 기본값은 현재)"""
+        try:
+            os.utime(path, None if mtime is None else (mtime, mtime))
+        except OSError:
+            pass
+    
+    def _prune_cache(self):
+        """오랫동안 갱신되지 않은 캐시 파일 삭제 (기간이 바뀔 때마다 생기는 일괄 조회 캐시 정리)"""
+        try:
+            if not self.CACHE_DIR.exists():
+                return
+            cutoff = time.time() - self.CACHE_MAX_AGE
+            for path in self.CACHE_DIR.iterdir():
+                if path.suffix in ('.parquet', '.tmp') and path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    
+    def _fetch_all_rows(self, params: Dict, extra_columns: Optional[List[str]] = None) -> Dict[str, list]:
+        """
+        첫 페이지로 전체 건수를 확인한 뒤 나머지 페이지(pIndex)를 병렬 조회
+        
+        페이지마다 필요한 필드만 컬럼 목록으로 옮기고 row dict는 바로 버림
+        (전체 row dict 목록을 메모리에 쌓지 않음)
+        
+        Returns:
+            {필드명: 값 목록}
+        """
+        fields = self.ROW_FIELDS + tuple(extra_columns or ())
+        columns = {field: [] for field in fields}
+        
+        def collect(rows: List[Dict]):
+            for field in fields:
+                columns[field].extend([row.get(field) for row in rows])
+        
+        rows, total_count = self._fetch_rows(params)
+        collect(rows)
+        
+        page_count = -(-total_count // params['pSize'])
+        if rows and page_count > 1:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, page_count - 1)) as executor:
+                pages = executor.map(
+                    lambda page: self._fetch_rows({**params, 'pIndex': page})[0],
+                    range(2, page_count + 1)
+                )
+                for page_rows in pages:
+                    collect(page_rows)
+        return columns
+    
+    def _fetch_rows(self, params: Dict) -> Tuple[List[Dict], int]:
+        """API 요청 후 (row 목록, 전체 건수) 반환"""
+        response = self.session.get(self.BASE_URL, params=params, timeout=30)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        
+        # 데이터가 없거나 오류이면 최상위 RESULT만 옴
+        # 인증키 오류, 트래픽 초과 등도 HTTP 200으로 오므로 '데이터 없음' 코드만 빈 결과로 처리
+        if 'SttsApiTblData' not in data:
+            result = data.get('RESULT') or {}
+            if result.get('CODE') == self.NO_DATA_CODE:
+                return [], 0
+            raise RuntimeError(f"API 오류 ({result.get('CODE')}): {result.get('MESSAGE', '')}")
+        
+        try:
+            stts_data = data['SttsApiTblData']
+            rows = stts_data[1]['row']
+        except (IndexError, KeyError, TypeError):
+            return [], 0
+        if not isinstance(rows, list):
+            rows = [rows]
+        
+        try:
+            total_count = int(stts_data[0]['head'][0]['list_total_count'])
+        except (KeyError, IndexError, TypeError, ValueError):
+            total_count = len(rows)
+        
+        return rows, total_count
+    
+    @staticmethod
+    def _columns_to_frame(
+        columns: Dict[str, list],
+        price_type: str,
+        extra_columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """API 필드별 값 목록 → (날짜, 지수, 가격유형) DataFrame"""
+        # 주간 데이터 처리
+        # WRTTIME_DESC가 실제 날짜 (YYYY-MM-DD 형식)
+        if columns['WRTTIME_DESC'][0] is not None:
+            dates = pd.to_datetime(columns['WRTTIME_DESC'], format='%Y-%m-%d', errors='coerce')
+        else:
+            # WRTTIME_DESC가 없으면 WRTTIME_IDTFR_ID 사용
+            dates = pd.to_datetime(columns['WRTTIME_IDTFR_ID'], format='%Y%m%d', errors='coerce')
+        
+        # 숫자 변환
+        # 지수는 소수점 2자리 값이므로 float32로 충분
+        values = pd.to_numeric(columns['DTA_VAL'], errors='coerce').astype(np.float32)
+        
+        # 필요한 컬럼만 선택
+        frame_columns = {'날짜': dates, '지수': values}
+        for column in extra_columns or []:
+            frame_columns[column] = columns[column]
+        result_df = pd.DataFrame(frame_columns)
+        # 캐시 저장 시 행마다 문자열을 pickle 하지 않도록 범주형으로 저장
+        result_df['가격유형'] = pd.Categorical.from_codes(
+            np.zeros(len(result_df), dtype=np.int8), categories=[price_type]
+        )
+        
+        # 결측값 제거 후 날짜로 정렬 (중간 DataFrame 생성 없이)
+        # API 응답은 보통 날짜순이므로 이미 정렬된 경우 정렬 생략
+        result_df.dropna(subset=['날짜', '지수'], inplace=True)
+        if result_df['날짜'].is_monotonic_increasing:
+            result_df.reset_index(drop=True, inplace=True)
+        else:
+            result_df.sort_values('날짜', inplace=True, ignore_index=True, kind='stable')
+        
+        return result_df
+    
+    def _use_bulk(self, region_count: int, start_date: str, end_date: str) -> bool:
+        """일괄 조회 페이지 수가 지역별 요청 수보다 적으면 일괄 조회"""
+        start_year, start_week = divmod(int(start_date), 100)
+        end_year, end_week = divmod(int(end_date), 100)
+        weeks = (end_year - start_year) * 52 + (end_week - start_week) + 1
+        pages = -(-weeks * len(self.REGION_CODES) // self.PAGE_SIZE)
+        return pages < region_count
+    
+    def _fetch_with_fallback(
+        self,
+        price_type: str,
+        start_date: str,
+        end_date: str,
+        region_code: str,
+        fetch_single: Callable[[str, str, str, str], Optional[pd.DataFrame]]
+    ) -> Tuple[Optional[pd.DataFrame], Optional[Exception], Optional[datetime]]:
+        """
+        지역별 조회 - 실패 시 만료된 디스크 캐시로 대체
+        
+        대체 처리는 fetch_single 밖에서 하므로 캐시된 조회 함수를 받아도
+        실패 결과는 캐시되지 않고, API가 복구되면 바로 새로 조회됨
+        
+        Returns:
+            (DataFrame 또는 None, 조회 오류, 대체에 사용한 캐시 저장 시각)
+        """
+        try:
+            return fetch_single(price_type, start_date, end_date, region_code), None, None
+        except Exception as e:
+            stale = self.get_stale_data(price_type, start_date, end_date, region_code)
+            if stale is not None:
+                return stale[0], e, stale[1]
+            return None, e, None
+    
     def get_multiple_data(
         self,
         price_types: List[str],
         start_date: str,
         end_date: str,
-        region_names: List[str]
+        region_names: List[str],
+        fetch_single: Optional[Callable[[str, str, str, str], Optional[pd.DataFrame]]] = None,
+        fetch_bulk: Optional[Callable[[str, str, str], Optional[Dict[str, pd.DataFrame]]]] = None
     ) -> pd.DataFrame:
         """
         여러 지역 및 가격유형 데이터를 한 번에 조회
@@ -388,78 +786,233 @@ class PriceIndexAPI:
             start_date: 시작일 (YYYYMMDD)
             end_date: 종료일 (YYYYMMDD)
             region_names: 지역명 리스트
+            fetch_single: 지역별 조회 함수 (기본값 self.get_data - 캐시된 조회 함수로 대체 가능)
+            fetch_bulk: 일괄 조회 함수 (기본값 self.get_data_bulk)
         
         Returns:
             통합된 DataFrame
         """
-        all_data = []
-        total_tasks = len(price_types) * len(region_names)
-        current_task = 0
-        
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        fetch_single = fetch_single or self.get_data
+        fetch_bulk = fetch_bulk or self.get_data_bulk
         
+        tasks = []
         for region_name in region_names:
             region_code = self.REGION_CODES.get(region_name)
             if not region_code:
                 continue
-            
             for price_type in price_types:
-                current_task += 1
-                status_text.text(f"조회 중... {region_name} {price_type} ({current_task}/{total_tasks})")
-                progress_bar.progress(current_task / total_tasks)
-                
-                df = self.get_data(price_type, start_date, end_date, region_code)
-                
-                if df is not None and not df.empty:
-                    df['지역'] = region_name
-                    all_data.append(df)
+                tasks.append((region_name, region_code, price_type))
+        
+        total_tasks = len(tasks)
+        results: List[Optional[pd.DataFrame]] = [None] * total_tasks
+        pending = list(range(total_tasks))
+        
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+        
+        # 지역이 많으면 가격유형별로 한 번에 조회 후 지역코드로 분리
+        if total_tasks and self._use_bulk(total_tasks // len(price_types), start_date, end_date):
+            index_by_type: Dict[str, Dict[str, int]] = {}
+            for i, (_, region_code, price_type) in enumerate(tasks):
+                index_by_type.setdefault(price_type, {})[region_code] = i
+            
+            pending = []
+            for price_type, index_by_code in index_by_type.items():
+                status_text.text(f"일괄 조회 중... {price_type} ({len(index_by_code)}개 지역)")
+                try:
+                    frames = fetch_bulk(price_type, start_date, end_date)
+                except Exception:
+                    frames = None
+                if frames is None:
+                    # 일괄 조회 실패 → 지역별 조회
+                    pending.extend(index_by_code.values())
+                    continue
+                for region_code, i in index_by_code.items():
+                    results[i] = frames.get(region_code)
+            pending.sort()
+        
+        # 작업 스레드에서도 st.* 호출이 가능하도록 스크립트 컨텍스트 전달
+        ctx = get_script_run_ctx()
+        errors: List[Exception] = []
+        stale_times: List[datetime] = []
+        
+        with ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS,
+            initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_with_fallback, tasks[i][2], start_date, end_date, tasks[i][1], fetch_single
+                ): i
+                for i in pending
+            }
+            
+            # 진행률은 약 5% 단위로만 갱신 (매 작업마다 브라우저 왕복 방지)
+            step = max(1, len(pending) // 20)
+            for current_task, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                results[i], error, cached_at = future.result()
+                if error is not None:
+                    errors.append(error)
+                    if cached_at is not None:
+                        stale_times.append(cached_at)
+                if current_task % step == 0 or current_task == len(pending):
+                    region_name, _, price_type = tasks[i]
+                    status_text.text(f"조회 중... {region_name} {price_type} ({current_task}/{len(pending)})")
+                    progress_bar.progress(current_task / len(pending))
         
         progress_bar.empty()
         status_text.empty()
         
-        if all_data:
-            combined = pd.concat(all_data, ignore_index=True)
-            return combined
-        else:
+        # 조회 오류는 지역별로 반복하지 않고 한 번에 표시
+        if stale_times:
+            st.warning(
+                f"데이터 조회 오류로 {len(stale_times)}건은 캐시 데이터를 사용합니다 "
+                f"(가장 오래된 캐시 {min(stale_times):%Y-%m-%d %H:%M}): {errors[0]}"
+            )
+        if len(errors) > len(stale_times):
+            st.error(f"데이터 조회 오류 ({len(errors) - len(stale_times)}건): {errors[0]}")
+        
+        # 요청 순서(지역 → 가격유형) 유지
+        frames = [
+            (tasks[i], df) for i, df in enumerate(results)
+            if df is not None and not df.empty
+        ]
+        if not frames:
             return pd.DataFrame()
+        
+        # 전체 행 수만큼 컬럼 배열을 한 번에 할당 후 구간별로 채움 (pd.concat 대체)
+        region_categories = list(dict.fromkeys(region_name for region_name, _, _ in tasks))
+        region_index = {name: i for i, name in enumerate(region_categories)}
+        type_index = {name: i for i, name in enumerate(price_types)}
+        
+        total_rows = sum(len(df) for _, df in frames)
+        dates = np.empty(total_rows, dtype=frames[0][1]['날짜'].dtype)
+        values = np.empty(total_rows, dtype=np.float32)
+        region_codes = np.empty(total_rows, dtype=np.int16)
+        type_codes = np.empty(total_rows, dtype=np.int8)
+        
+        offset = 0
+        for (region_name, _, price_type), df in frames:
+            end = offset + len(df)
+            dates[offset:end] = df['날짜'].to_numpy()
+            values[offset:end] = df['지수'].to_numpy()
+            region_codes[offset:end] = region_index[region_name]
+            type_codes[offset:end] = type_index[price_type]
+            offset = end
+        
+        # 반복되는 문자열은 범주형으로 저장 (groupby 시 정수 코드로 해싱)
+        return pd.DataFrame({
+            '날짜': dates,
+            '지수': values,
+            '가격유형': pd.Categorical.from_codes(type_codes, categories=price_types),
+            '지역': pd.Categorical.from_codes(region_codes, categories=region_categories),
+        })
+
+
+# 사이드바 지역 목록 / 기본 선택 지역 (재실행마다 다시 만들지 않도록 모듈 상수로 유지)
+REGION_LIST = tuple(PriceIndexAPI.REGION_CODES.keys())
+DEFAULT_REGIONS = (
+    # '서울',
+    # '경기',
+    '서울>강남지역',
+    '서울>강북지역',
+    '경기>경부1권>성남시>분당구',
+    '경기>경부1권>과천시',
+    '경기>경부2권>수원시>영통구',
+    '경기>경부2권>용인시>수지구',
+    '인천>연수구',
+    '경기>서해안권>평택시',
+    '세종',
+    '대구>수성구',
+    '부산>동부산권>해운대구',
+)
+
+
+@st.cache_resource
+def get_api(api_key: str) -> PriceIndexAPI:
+    """API 클라이언트 (세션 연결 풀을 재실행 간에 공유)"""
+    return PriceIndexAPI(api_key)
+
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_single(api_key: str, price_type: str, start_date: str, end_date: str, region_code: str):
+    """(가격유형, 기간, 지역) 단위 조회 (캐시 사용)"""
+    return get_api(api_key).get_data(price_type, start_date, end_date, region_code)
 
-@st.cache_data(ttl=3600)
-def load_data(api_key: str, price_types: List[str], start_date: str, end_date: str, regions: List[str]):
-    """데이터 로드 (캐시 사용)"""
-    api = PriceIndexAPI(api_key)
-    return api.get_multiple_data(price_types, start_date, end_date, regions)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_bulk(api_key: str, price_type: str, start_date: str, end_date: str):
+    """(가격유형, 기간) 단위 전체 지역 일괄 조회 (캐시 사용)"""
+    return get_api(api_key).get_data_bulk(price_type, start_date, end_date)
+
+
+def load_data(
+    api_key: str,
+    price_types: Tuple[str, ...],
+    start_date: str,
+    end_date: str,
+    regions: Tuple[str, ...]
+):
+    """
+    데이터 로드 (지역/가격유형 단위 캐시 사용 - 지역 추가/제거 시 기존 결과 재사용)
+    
+    price_types/regions는 정렬된 튜플로 전달 - 선택 순서가 달라도 같은 결과(및 차트 캐시 키)
+    """
+    return get_api(api_key).get_multiple_data(
+        list(price_types), start_date, end_date, list(regions),
+        fetch_single=partial(_fetch_single, api_key),
+        fetch_bulk=partial(_fetch_bulk, api_key)
+    )
 
 
 def calculate_date_range(period: str, custom_start: Optional[str] = None, custom_end: Optional[str] = None):
     """기간에 따른 날짜 범위 계산"""
-    end_date = datetime.now()
-    
-    if period == "1년":
-        start_date = end_date - timedelta(days=365)
-    elif period == "3년":
-        start_date = end_date - timedelta(days=365*3)
-    elif period == "5년":
-        start_date = end_date - timedelta(days=365*5)
-    elif period == "10년":
-        start_date = end_date - timedelta(days=365*10)
-    elif period == "사용자 지정":
-        if custom_start and custom_end:
-            start_date = datetime.strptime(custom_start, '%Y-%m-%d')
-            end_date = datetime.strptime(custom_end, '%Y-%m-%d')
-        else:
-            start_date = end_date - timedelta(days=365)
+    end_date = date.today()
+    
+    if period == _CUSTOM and custom_start and custom_end:
+        start_date = date.fromisoformat(custom_start)
+        end_date = date.fromisoformat(custom_end)
     else:
-        start_date = end_date - timedelta(days=365)
+        start_date = end_date - timedelta(days=_PERIOD_DAYS.get(period, 365))
     
-    # YYYYWW 형식으로 변환 (년도 + 주차)
+    # YYYYWW 형식으로 변환 (년도 + 주차) - 재실행 시 같은 날짜는 캐시에서 조회
     start_str = date_to_week_format(start_date)
     end_str = date_to_week_format(end_date)
     
     return start_str, end_str
 
 
+def _frame_digest(df: pd.DataFrame) -> str:
+    """
+    st.cache_data 용 DataFrame 해시 (컬럼 버퍼를 그대로 해싱)
+    
+    기본 해셔는 행 단위 해시(hash_pandas_object)를 계산하므로,
+    조회 결과처럼 숫자/날짜/범주형 컬럼만 있는 경우 원시 바이트로 빠르게 해싱
+    """
+    h = hashlib.sha1()
+    index = df.index
+    if isinstance(index, pd.RangeIndex):
+        h.update(repr((index.start, index.stop, index.step)).encode())
+    else:
+        h.update(pd.util.hash_pandas_object(index).to_numpy().tobytes())
+    for name, column in df.items():
+        h.update(f"{name}:{column.dtype}".encode())
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            h.update(repr(tuple(column.cat.categories)).encode())
+            h.update(column.cat.codes.to_numpy().tobytes())
+        elif isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biufmM':
+            # 숫자/날짜 컬럼만 원시 버퍼 해싱 (문자열 등은 값 기준 해시 사용)
+            h.update(np.ascontiguousarray(column.to_numpy()).tobytes())
+        else:
+            h.update(pd.util.hash_pandas_object(column, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+# 조회 결과 DataFrame을 인자로 받는 캐시 함수용 해셔
+_FRAME_HASH_FUNCS = {pd.DataFrame: _frame_digest}
+
+
 def create_chart(df: pd.DataFrame, chart_type: str, regions: List[str], normalize: bool = False):
     """차트 생성"""
     
@@ -467,104 +1020,66 @@ def create_chart(df: pd.DataFrame, chart_type: str, regions: List[str], normaliz
         st.warning("표시할 데이터가 없습니다.")
         return
     
+    # 동일 조건 재조회 시 생성된 Figure 객체 재사용 (plotly_chart는 Figure를 변경하지 않음)
+    fig = _build_chart_figure(df, chart_type, tuple(regions), normalize)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource(ttl=600, max_entries=32, show_spinner=False, hash_funcs=_FRAME_HASH_FUNCS)
+def _build_chart_figure(df: pd.DataFrame, chart_type: str, regions: Tuple[str, ...], normalize: bool) -> go.Figure:
+    """차트 Figure 생성 (캐시 사용)"""
+    
     # 보정 처리
     if normalize:
-        # 2022년 1월 31일에 해당하는 주차 계산
         base_date = datetime(2022, 1, 31)
-        base_week = date_to_week_format(base_date)  # 202205 형식
-        
-        # 기준일 데이터로 정규화
-        df_normalized = df.copy()
-        
-        for region in regions:
-            for price_type in df['가격유형'].unique():
-                mask = (df_normalized['지역'] == region) & (df_normalized['가격유형'] == price_type)
-                region_data = df_normalized[mask].copy()
-                
-                if not region_data.empty:
-                    # 2022-01-31에 가장 가까운 날짜 찾기
-                    region_data['날짜_diff'] = abs((region_data['날짜'] - base_date).dt.days)
-                    base_idx = region_data['날짜_diff'].idxmin()
-                    base_value = region_data.loc[base_idx, '지수']
-                    
-                    if base_value and base_value > 0:
-                        # 100 기준으로 정규화
-                        df_normalized.loc[mask, '지수'] = (df_normalized.loc[mask, '지수'] / base_value) * 100
-        
-        df = df_normalized
-    
-    fig = go.Figure()
+        
+        # (지역, 가격유형)별로 2022-01-31에 가장 가까운 행의 지수를 기준값으로 사용
+        keys = [df['지역'], df['가격유형']]
+        date_diff = (df['날짜'] - base_date).abs()
+        base_idx = date_diff.groupby(keys, sort=False, observed=True).transform('idxmin')
+        base_value = df['지수'].loc[base_idx].to_numpy()
+        
+        # 100 기준으로 정규화 (기준값이 없거나 0 이하인 경우 원본 유지)
+        df = df.assign(지수=np.where(base_value > 0, df['지수'] / base_value * 100, df['지수']))
     
-    if chart_type == "매매":
-        # 매매 지수만
-        df_filtered = df[df['가격유형'] == '매매']
-        
-        for region in regions:
-            region_data = df_filtered[df_filtered['지역'] == region]
-            if not region_data.empty:
-                fig.add_trace(go.Scatter(
-                    x=region_data['날짜'],
-                    y=region_data['지수'],
-                    mode='lines',
-                    name=f"{region}",
-                    line=dict(width=2),
-                    hovertemplate='<b>%{fullData.name}</b><br>' +
-                                  '날짜: %{x|%Y-%m-%d}<br>' +
-                                  ('지수: %{y:.2f}' if normalize else '지수: %{y:.2f}') +
-                                  '<extra></extra>'
-                ))
+    # (가격유형, 지역)별 행 위치를 한 번에 계산
+    groups = df.groupby(['가격유형', '지역'], sort=False, observed=True).indices
     
-    elif chart_type == "전세":
-        # 전세 지수만
-        df_filtered = df[df['가격유형'] == '전세']
-        
-        for region in regions:
-            region_data = df_filtered[df_filtered['지역'] == region]
-            if not region_data.empty:
-                fig.add_trace(go.Scatter(
-                    x=region_data['날짜'],
-                    y=region_data['지수'],
-                    mode='lines',
-                    name=f"{region}",
-                    line=dict(width=2),
-                    hovertemplate='<b>%{fullData.name}</b><br>' +
-                                  '날짜: %{x|%Y-%m-%d}<br>' +
-                                  ('지수: %{y:.2f}' if normalize else '지수: %{y:.2f}') +
-                                  '<extra></extra>'
-                ))
-    
-    elif chart_type == "매매/전세":
-        # 매매와 전세를 동시에 표시
-        for region in regions:
-            # 매매 데이터
-            df_sale = df[(df['지역'] == region) & (df['가격유형'] == '매매')]
-            if not df_sale.empty:
-                fig.add_trace(go.Scatter(
-                    x=df_sale['날짜'],
-                    y=df_sale['지수'],
-                    mode='lines',
-                    name=f"{region} 매매",
-                    line=dict(width=2, dash='solid'),
-                    hovertemplate='<b>%{fullData.name}</b><br>' +
-                                  '날짜: %{x|%Y-%m-%d}<br>' +
-                                  ('지수: %{y:.2f}' if normalize else '지수: %{y:.2f}') +
-                                  '<extra></extra>'
-                ))
-            
-            # 전세 데이터
-            df_jeonse = df[(df['지역'] == region) & (df['가격유형'] == '전세')]
-            if not df_jeonse.empty:
-                fig.add_trace(go.Scatter(
-                    x=df_jeonse['날짜'],
-                    y=df_jeonse['지수'],
-                    mode='lines',
-                    name=f"{region} 전세",
-                    line=dict(width=2, dash='dot'),
-                    hovertemplate='<b>%{fullData.name}</b><br>' +
-                                  '날짜: %{x|%Y-%m-%d}<br>' +
-                                  ('지수: %{y:.2f}' if normalize else '지수: %{y:.2f}') +
-                                  '<extra></extra>'
-                ))
+    if chart_type == "매매/전세":
+        # 매매(실선)와 전세(점선)를 동시에 표시
+        series = [
+            (price_type, region, f"{region} {price_type}", dict(width=2, dash=dash))
+            for region in regions
+            for price_type, dash in (('매매', 'solid'), ('전세', 'dot'))
+        ]
+    else:
+        # 매매 또는 전세 지수만
+        series = [(chart_type, region, f"{region}", dict(width=2)) for region in regions]
+    
+    hovertemplate = ('<b>%{fullData.name}</b><br>' +
+                     '날짜: %{x|%Y-%m-%d}<br>' +
+                     '지수: %{y:.2f}' +
+                     '<extra></extra>')
+    
+    # 점이 많으면 SVG 대신 WebGL로 렌더링 (Figure 하나 = WebGL 컨텍스트 하나)
+    trace_type = 'scattergl' if len(df) >= CHART_WEBGL_MIN_POINTS else 'scatter'
+    
+    # 트레이스를 dict로 모아 Figure 생성 시 한 번에 전달
+    traces = []
+    for price_type, region, name, line in series:
+        idx = groups.get((price_type, region))
+        if idx is None:
+            continue
+        series_data = df.iloc[idx]
+        traces.append(dict(
+            type=trace_type,
+            x=series_data['날짜'],
+            y=series_data['지수'],
+            mode='lines',
+            name=name,
+            line=line,
+            hovertemplate=hovertemplate
+        ))
     
     # 레이아웃 설정
     if chart_type == "매매/전세":
@@ -578,7 +1093,7 @@ def create_chart(df: pd.DataFrame, chart_type: str, regions: List[str], normaliz
     else:
         yaxis_title = "지수"
     
-    fig.update_layout(
+    layout = dict(
         title=title,
         xaxis_title="날짜 (주간)",
         yaxis_title=yaxis_title,
@@ -594,7 +1109,7 @@ def create_chart(df: pd.DataFrame, chart_type: str, regions: List[str], normaliz
         margin=dict(r=150)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return go.Figure(data=traces, layout=layout)
 
 
 def create_heatmap(df: pd.DataFrame, regions: List[str], chart_type: str, mode: str = "누적 변화율"):
@@ -629,71 +1144,90 @@ def _create_single_heatmap(df: pd.DataFrame, regions: List[str], title: str, mod
         st.warning("히트맵을 그릴 데이터가 없습니다.")
         return
     
-    # 각 지역의 데이터 처리
-    heatmap_data = []
-    
-    for region in regions:
-        region_data = df[df['지역'] == region].sort_values('날짜')
-        
-        if not region_data.empty and len(region_data) > 0:
-            region_data = region_data.copy()
-            
-            if mode == "누적 변화율":
-                # 최초 지수 대비 변화율
-                base_index = region_data.iloc[0]['지수']
-                
-                if base_index and base_index > 0:
-                    region_data['변화율'] = ((region_data['지수'] - base_index) / base_index) * 100
-                    region_data['지역'] = region
-                    heatmap_data.append(region_data[['날짜', '지역', '변화율']])
-            
-            else:  # 전주 변동률
-                # 전주 대비 변동률 계산
-                region_data['변화율'] = region_data['지수'].pct_change() * 100
-                region_data['지역'] = region
-                # 첫 번째 값은 NaN이므로 0으로 처리
-                region_data['변화율'] = region_data['변화율'].fillna(0)
-                heatmap_data.append(region_data[['날짜', '지역', '변화율']])
-    
-    if not heatmap_data:
+    # Figure 생성은 캐시 (같은 조회 결과로 다시 그릴 때 재계산 없음)
+    result = _build_heatmap_figure(df, tuple(regions), title, mode)
+    if result is None:
         st.warning("히트맵을 그릴 데이터가 없습니다.")
         return
+    fig, total_weeks = result
+    
+    # 데이터 포인트 수 표시
+    if mode == "누적 변화율":
+        st.info(f"📅 총 {total_weeks}주 데이터 표시 중 (최초 시점 대비 누적 변화율)")
+    else:  # 전주 변동률
+        st.info(f"📅 총 {total_weeks}주 데이터 표시 중 (전주 대비 변동률)")
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource(ttl=600, max_entries=32, show_spinner=False, hash_funcs=_FRAME_HASH_FUNCS)
+def _build_heatmap_figure(
+    df: pd.DataFrame,
+    regions: Tuple[str, ...],
+    title: str,
+    mode: str
+) -> Optional[Tuple[go.Figure, int]]:
+    """히트맵 Figure 생성 후 (Figure, 주 수) 반환 - 데이터가 없으면 None (캐시 사용)"""
+    
+    # 선택 지역만 (지역, 날짜)순 정렬 - 지역별 행이 연속된 구간이 됨
+    region_df = df.loc[df['지역'].isin(regions), ['날짜', '지역', '지수']]
+    region_df['지역'] = region_df['지역'].astype(str)
+    region_df = region_df.sort_values(['지역', '날짜'], kind='stable')
     
-    # 데이터 결합
-    combined_df = pd.concat(heatmap_data, ignore_index=True)
+    if region_df.empty:
+        return None
     
-    # 피벗 테이블 생성: 날짜(x축) x 지역(y축)
-    pivot_df = combined_df.pivot(index='지역', columns='날짜', values='변화율')
+    if mode == "누적 변화율":
+        # 최초 지수 대비 변화율
+        base_index = region_df.groupby('지역', sort=False)['지수'].transform('first')
+        region_df['변화율'] = ((region_df['지수'] - base_index) / base_index) * 100
+        region_df = region_df[base_index > 0]
+    else:  # 전주 변동률
+        # 연속된 float32 배열에서 전주 대비 변동률 계산
+        values = region_df['지수'].to_numpy(dtype=np.float32)
+        region_names = region_df['지역'].to_numpy()
+        change = np.zeros_like(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change[1:] = (values[1:] - values[:-1]) / values[:-1] * 100
+        # 지역별 첫 번째 값(이전 주 없음)과 0/0은 0으로 처리
+        change[np.r_[True, region_names[1:] != region_names[:-1]]] = 0
+        change[np.isnan(change)] = 0
+        region_df['변화율'] = change
     
-    # 지역 순서 유지
-    pivot_df = pivot_df.reindex(regions)
+    if region_df.empty:
+        return None
     
-    # 데이터 포인트 수 표시
-    total_weeks = len(pivot_df.columns)
+    # 날짜(x축) x 지역(y축) 2차원 배열을 직접 채움 (지역 순서 유지, 빈 칸은 NaN)
+    week_dates, col_ids = np.unique(region_df['날짜'].to_numpy(), return_inverse=True)
+    region_to_row = {region: i for i, region in enumerate(regions)}
+    row_ids = region_df['지역'].map(region_to_row).to_numpy()
+    z = np.full((len(regions), len(week_dates)), np.nan, dtype=np.float32)
+    z[row_ids, col_ids] = region_df['변화율'].to_numpy()
+    
+    total_weeks = len(week_dates)
     
     if mode == "누적 변화율":
         mode_text = "최초 시점 대비"
-        st.info(f"📅 총 {total_weeks}주 데이터 표시 중 (최초 시점 대비 누적 변화율)")
         zmin, zmax = -10, 10
         colorbar_title = "누적 변화율(%)"
     else:  # 전주 변동률
         mode_text = "전주 대비"
-        st.info(f"📅 총 {total_weeks}주 데이터 표시 중 (전주 대비 변동률)")
         zmin, zmax = -1, 1  # 전주 변동률은 -1% ~ +1%
         colorbar_title = "전주 변동률(%)"
     
     # 히트맵 생성
-    fig = go.Figure(data=go.Heatmap(
-        z=pivot_df.values,
-        x=pivot_df.columns,
-        y=pivot_df.index,
+    heatmap = dict(
+        type='heatmap',
+        z=z,
+        x=week_dates,
+        y=list(regions),
         colorscale='RdYlGn',  # 빨강(하락)-노랑(중립)-초록(상승)
         zmid=0,  # 0을 중간값으로
         colorbar=dict(title=colorbar_title),
         hovertemplate='지역: %{y}<br>날짜: %{x|%Y-%m-%d}<br>' + colorbar_title + ': %{z:.3f}%<extra></extra>',
         zmin=zmin,
         zmax=zmax,
-    ))
+    )
     
     # x축 틱 간격 계산 (주 수에 따라 조정)
     if total_weeks <= 12:
@@ -703,7 +1237,7 @@ def _create_single_heatmap(df: pd.DataFrame, regions: List[str], title: str, mod
     else:
         dtick = 7 * 24 * 60 * 60 * 1000 * 8  # 8주마다
     
-    fig.update_layout(
+    layout = dict(
         title=f"{title} ({mode_text})",
         xaxis_title="날짜 (주간)",
         yaxis_title="지역",
@@ -716,7 +1250,82 @@ def _create_single_heatmap(df: pd.DataFrame, regions: List[str], title: str, mod
         margin=dict(l=200, r=50, t=80, b=100)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return go.Figure(data=[heatmap], layout=layout), total_weeks
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False, hash_funcs=_FRAME_HASH_FUNCS)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV 다운로드용 바이트 생성 (pyarrow CSV writer, 엑셀 호환 BOM 포함)"""
+    # 범주형은 문자열로, 날짜는 Arrow에서 date32로 변환해 YYYY-MM-DD로 기록
+    table = pa.Table.from_pandas(
+        df.assign(**{col: df[col].astype(str) for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)}),
+        preserve_index=False
+    )
+    date_index = table.schema.get_field_index('날짜')
+    table = table.set_column(date_index, '날짜', pa_compute.cast(table.column(date_index), pa.date32()))
+    # 지역명에 쉼표/따옴표가 없으므로 따옴표 없이 기록 (헤더는 pandas 출력과 같게 직접 작성)
+    header = (','.join(table.column_names) + '\n').encode('utf-8-sig')
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(table, sink, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+    return header + sink.getvalue().to_pybytes()
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False, hash_funcs=_FRAME_HASH_FUNCS)
+def _to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Parquet 다운로드용 바이트 생성 (zstd 압축)"""
+    return df.to_parquet(index=False, compression='zstd')
+
+
+@st.fragment
+def _render_data_tab(df: pd.DataFrame, start_date: str, end_date: str, summary: Dict[str, int]):
+    """
+    데이터 탭 (fragment)
+    
+    다운로드 버튼 클릭 시 전체 스크립트 대신 이 영역만 다시 실행되어
+    조회 결과 화면이 사라지지 않음
+    """
+    # 원본 데이터 표시
+    st.subheader("조회 데이터")
+    
+    # 다운로드 버튼 (직렬화 결과는 캐시)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="📥 CSV 다운로드",
+            data=_to_csv_bytes(df),
+            file_name=f"price_index_{start_date}_{end_date}.csv",
+            mime="text/csv"
+        )
+    with col2:
+        st.download_button(
+            label="📥 Parquet 다운로드",
+            data=_to_parquet_bytes(df),
+            file_name=f"price_index_{start_date}_{end_date}.parquet",
+            mime="application/vnd.apache.parquet"
+        )
+    
+    # 데이터프레임 표시 (숫자/날짜 서식은 프론트엔드에서 적용)
+    st.dataframe(
+        df,
+        use_container_width=True,
+        height=400,
+        column_config={
+            '날짜': st.column_config.DateColumn(format='YYYY-MM-DD'),
+            '지수': st.column_config.NumberColumn(format='%.2f'),
+        }
+    )
+    
+    # 데이터 요약
+    st.subheader("데이터 요약")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("총 데이터 수", f"{summary['rows']:,}건")
+    with col2:
+        st.metric("지역 수", f"{summary['regions']}개")
+    with col3:
+        st.metric("가격유형", f"{summary['types']}개")
+    with col4:
+        st.metric("기간", f"{summary['days']}일")
 
 
 def main():
@@ -727,8 +1336,11 @@ def main():
     st.markdown("한국 부동산원 주간 매매/전세 가격지수")
     
     # 현재 날짜 표시
-    current_date = datetime.now()
-    st.caption(f"📅 오늘 날짜: {current_date.strftime('%Y년 %m월 %d일 (%A)')}")
+    current_date = date.today()
+    st.caption(
+        f"📅 오늘 날짜: {current_date.strftime('%Y년 %m월 %d일')} "
+        f"({_WEEKDAY_NAMES[current_date.weekday()]})"
+    )
     
     # API 키 확인
     try:
@@ -752,39 +1364,15 @@ def main():
     # 지역 선택
     st.sidebar.subheader("📍 지역 선택")
     
-    region_list = list(PriceIndexAPI.REGION_CODES.keys())
-    
     # 전체 선택 옵션
     select_all = st.sidebar.checkbox("전체 선택", value=False)
     
-    if select_all:
-        selected_regions = st.sidebar.multiselect(
-            "지역",
-            options=region_list,
-            default=region_list,
-            label_visibility="collapsed"
-        )
-    else:
-        selected_regions = st.sidebar.multiselect(
-            "지역",
-            options=region_list,
-            default=[
-                # '서울',
-                # '경기',
-                '서울>강남지역',
-                '서울>강북지역',
-                '경기>경부1권>성남시>분당구',
-                '경기>경부1권>과천시',
-                '경기>경부2권>수원시>영통구',
-                '경기>경부2권>용인시>수지구',
-                '인천>연수구',
-                '경기>서해안권>평택시',
-                '세종',
-                '대구>수성구',
-                '부산>동부산권>해운대구'
-            ],
-            label_visibility="collapsed"
-        )
+    selected_regions = st.sidebar.multiselect(
+        "지역",
+        options=REGION_LIST,
+        default=REGION_LIST if select_all else DEFAULT_REGIONS,
+        label_visibility="collapsed"
+    )
     
     # 기간 선택
     st.sidebar.subheader("📅 기간 선택")
@@ -800,18 +1388,18 @@ def main():
     if period == "사용자 지정":
         col1, col2 = st.sidebar.columns(2)
         with col1:
-            default_start = datetime(2013, 8, 5)  # 2013년 8월 5일
+            default_start = date(2013, 8, 5)  # 2013년 8월 5일
             custom_start = st.date_input(
                 "시작일",
                 value=default_start,
-                max_value=datetime.now()
-            ).strftime('%Y-%m-%d')
+                max_value=current_date
+            ).isoformat()
         with col2:
             custom_end = st.date_input(
                 "종료일",
-                value=datetime.now(),
-                max_value=datetime.now()
-            ).strftime('%Y-%m-%d')
+                value=current_date,
+                max_value=current_date
+            ).isoformat()
     
     # 차트 유형 선택
     st.sidebar.subheader("📊 차트 유형")
@@ -844,24 +1432,16 @@ def main():
     
     # 현재 설정 미리보기
     if selected_regions:
-        preview_end = datetime.now()
-        if period == "1년":
-            preview_start = preview_end - timedelta(days=365)
-        elif period == "3년":
-            preview_start = preview_end - timedelta(days=365*3)
-        elif period == "5년":
-            preview_start = preview_end - timedelta(days=365*5)
-        elif period == "10년":
-            preview_start = preview_end - timedelta(days=365*10)
-        elif period == "사용자 지정" and custom_start and custom_end:
-            preview_start = datetime.strptime(custom_start, '%Y-%m-%d')
-            preview_end = datetime.strptime(custom_end, '%Y-%m-%d')
+        preview_end = current_date
+        if period == _CUSTOM and custom_start and custom_end:
+            preview_start = date.fromisoformat(custom_start)
+            preview_end = date.fromisoformat(custom_end)
         else:
-            preview_start = preview_end - timedelta(days=365)
+            preview_start = preview_end - timedelta(days=_PERIOD_DAYS.get(period, 365))
         
         st.sidebar.info(f"""
         📅 **조회 기간**  
-        {preview_start.strftime('%Y-%m-%d')} ~ {preview_end.strftime('%Y-%m-%d')}  
+        {preview_start.isoformat()} ~ {preview_end.isoformat()}  
         ({(preview_end - preview_start).days}일)
         
         📍 **선택 지역**: {len(selected_regions)}개  
@@ -880,10 +1460,8 @@ def main():
         start_date, end_date = calculate_date_range(period, custom_start, custom_end)
         
         # 주차를 날짜로 변환해서 표시 (YYYYWW → 년도, 주차)
-        start_year = int(start_date[:4])
-        start_week = int(start_date[4:])
-        end_year = int(end_date[:4])
-        end_week = int(end_date[4:])
+        start_year, start_week = divmod(int(start_date), 100)
+        end_year, end_week = divmod(int(end_date), 100)
         
         # 날짜 확인용 메시지
         st.success(f"""
@@ -904,30 +1482,40 @@ def main():
         
         # 데이터 로드
         with st.spinner("데이터를 불러오는 중..."):
-            df = load_data(api_key, price_types, start_date, end_date, selected_regions)
+            df = load_data(
+                api_key, tuple(sorted(price_types)), start_date, end_date, tuple(sorted(selected_regions))
+            )
         
         if df.empty:
             st.error("조회된 데이터가 없습니다. 기간을 조정하거나 다른 지역을 선택해보세요.")
             return
         
+        # 요약 지표는 한 번만 계산해 조회 정보/데이터 탭에서 공유
+        dates = df['날짜']
+        summary = {
+            'rows': len(df),
+            'regions': df['지역'].nunique(),
+            'types': df['가격유형'].nunique(),
+            'days': (dates.max() - dates.min()).days,
+        }
+        
         # 데이터 정보 표시
         with st.expander("📊 데이터 조회 정보", expanded=False):
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("총 데이터", f"{len(df):,}건")
+                st.metric("총 데이터", f"{summary['rows']:,}건")
             with col2:
-                st.metric("지역 수", f"{df['지역'].nunique()}개")
+                st.metric("지역 수", f"{summary['regions']}개")
             with col3:
-                date_range = (df['날짜'].max() - df['날짜'].min()).days
-                st.metric("기간", f"{date_range}일")
+                st.metric("기간", f"{summary['days']}일")
             with col4:
-                weeks = len(df) // (df['지역'].nunique() * df['가격유형'].nunique())
+                weeks = summary['rows'] // (summary['regions'] * summary['types'])
                 st.metric("주차", f"약 {weeks}주")
             
             # 지역별 데이터 수
             st.write("**지역별 데이터 수:**")
-            region_counts = df.groupby(['지역', '가격유형']).size().unstack(fill_value=0)
+            region_counts = df.groupby(['지역', '가격유형'], observed=True).size().unstack(fill_value=0)
             st.dataframe(region_counts, use_container_width=True)
         
         # 탭 생성
@@ -947,32 +1535,7 @@ def main():
             create_heatmap(df, selected_regions, chart_type, heatmap_mode)
         
         with tab3:
-            # 원본 데이터 표시
-            st.subheader("조회 데이터")
-            
-            # 다운로드 버튼
-            csv = df.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
-            st.download_button(
-                label="📥 CSV 다운로드",
-                data=csv,
-                file_name=f"price_index_{start_date}_{end_date}.csv",
-                mime="text/csv"
-            )
-            
-            # 데이터프레임 표시
-            st.dataframe(df, use_container_width=True, height=400)
-            
-            # 데이터 요약
-            st.subheader("데이터 요약")
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("총 데이터 수", f"{len(df):,}건")
-            with col2:
-                st.metric("지역 수", f"{df['지역'].nunique()}개")
-            with col3:
-                st.metric("가격유형", f"{df['가격유형'].nunique()}개")
-            with col4:
-                st.metric("기간", f"{(df['날짜'].max() - df['날짜'].min()).days}일")
+            _render_data_tab(df, start_date, end_date, summary)
     
     else:
         # 초기 화면